@@ -0,0 +1,45 @@
+"""partial index on active orders
+
+Revision ID: b3f1c2d4e5a6
+Revises: 676afa314708
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f1c2d4e5a6'
+down_revision: Union[str, Sequence[str], None] = '676afa314708'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# статусы зафиксированы на момент миграции, не импортируются из моделей
+ACTIVE_STATUSES = ("draft", "confirmed", "shipped")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY не блокирует запись в orders, но не может идти в транзакции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_orders_active_status_created_at',
+            'orders',
+            ['status', 'created_at', 'id'],
+            unique=False,
+            postgresql_where=sa.column('status').in_(ACTIVE_STATUSES),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_orders_active_status_created_at',
+            table_name='orders',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,98 @@
+"""
+Микробенчмарк Python-накладных расходов пути "добавление товара в заказ".
+
+Сетевые round trip к PostgreSQL исключены: используется SQLite в памяти
+с одним соединением (StaticPool). Время выполнения запросов самим SQLite
+в замер всё же входит, поэтому цифры — это стоимость UoW, построения и
+компиляции запросов и работы ORM плюс небольшая внутрипроцессная доля БД.
+
+Запуск:
+    python -m benchmarks.bench_add_item [--iterations N]
+"""
+import argparse
+import os
+import timeit
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite://")
+
+from sqlalchemy import select  # noqa: E402
+
+from src.models import Order, OrderItem, Product  # noqa: E402
+from src.services import OrderService, ProductCatalogCache  # noqa: E402
+from src.memory_db import make_memory_session_factory  # noqa: E402
+from src.unit_of_work import SqlAlchemyUnitOfWork  # noqa: E402
+
+
+def make_session_factory():
+    factory = make_memory_session_factory()
+    with factory() as session:
+        session.add(Order(id=1))
+        session.add(Product(id=1, name="TV", price=1000, stock=10 ** 9))
+        session.commit()
+
+    return factory
+
+
+def bench_empty_uow(session_factory):
+    """UoW, который не трогает БД (ping, валидация)."""
+    with SqlAlchemyUnitOfWork(session_factory):
+        pass
+
+
+def bench_add_item(session_factory):
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        OrderService(uow).add_item(order_id=1, product_id=1, quantity=1)
+
+
+CATALOG = ProductCatalogCache()
+
+
+def bench_add_item_cached(session_factory):
+    """add_item с кэшем атрибутов каталога: без чтения name/price из БД."""
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        OrderService(uow, CATALOG).add_item(order_id=1, product_id=1, quantity=1)
+
+
+def bench_adhoc_statement(session_factory):
+    """Запрос get_by_order_and_product, собираемый заново без lambda_stmt.
+
+    Обёртка (UoW, autobegin, commit в __exit__) та же, что в
+    bench_cached_statement, — разница между ними только в построении запроса.
+    """
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        stmt = (
+            select(OrderItem)
+            .where(OrderItem.order_id == 1, OrderItem.product_id == 1)
+            .with_for_update()
+        )
+        uow.session.execute(stmt).scalar_one_or_none()
+
+
+def bench_cached_statement(session_factory):
+    """Тот же запрос через OrderItemRepository (lambda_stmt)."""
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        uow.item_repo.get_by_order_and_product(1, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    session_factory = make_session_factory()
+    cases = [
+        ("empty uow", bench_empty_uow),
+        ("add_item", bench_add_item),
+        ("add_item, catalog cache", bench_add_item_cached),
+        ("item lookup, ad hoc select", bench_adhoc_statement),
+        ("item lookup, lambda_stmt", bench_cached_statement),
+    ]
+
+    for name, fn in cases:
+        fn(session_factory)  # прогрев кэшей SQLAlchemy
+        total = timeit.timeit(lambda: fn(session_factory), number=args.iterations)
+        print(f"{name:<30} {total / args.iterations * 1e6:10.1f} us/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Бенчмарк отчётных запросов из SOLUTION.md на PostgreSQL.
+
+Каждый запрос выполняется --repeat раз (после прогрева), фиксируются
+min/median/max времени и план EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON).
+Результат пишется в JSON, чтобы сравнивать прогоны до и после изменения
+схемы или индексов (--label помечает прогон).
+
+Данные готовит benchmarks.dataset. Запуск:
+    python -m benchmarks.bench_reports --label baseline --output reports_baseline.json
+"""
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+
+from src.config import Config
+from src.models import OrderStatus
+from src.repositories import OrderRepository
+
+REPORT_QUERIES = {
+    # 2.1 сумма заказанных товаров по клиентам
+    "client_totals": """
+        SELECT
+          c.id AS client_id,
+          c.name AS client_name,
+          COALESCE(SUM(oi.quantity * oi.unit_price),0) AS total_sum
+        FROM clients c
+        LEFT JOIN orders o ON o.client_id = c.id
+        LEFT JOIN order_items oi ON oi.order_id = o.id
+        GROUP BY c.id, c.name
+        ORDER BY total_sum DESC
+    """,
+    # 2.2 количество дочерних категорий первого уровня
+    "first_level_children": """
+        SELECT
+            c.id,
+            c.name,
+            (
+                SELECT COUNT(*)
+                FROM categories AS ch
+                WHERE ch.parent_id = c.id
+            ) AS first_level_children_count
+        FROM categories AS c
+        WHERE c.parent_id IS NULL
+        ORDER BY c.name
+    """,
+    # 2.3.1 топ-5 за прошлый месяц, категория 1-го уровня через WITH RECURSIVE
+    "top5_last_month_recursive": """
+        WITH RECURSIVE category_hierarchy AS (
+            SELECT id, parent_id, name, name AS root_name
+            FROM categories
+            WHERE parent_id IS NULL
+
+            UNION ALL
+
+            SELECT c.id, c.parent_id, c.name, ch.root_name
+            FROM categories AS c
+            JOIN category_hierarchy AS ch ON ch.id = c.parent_id
+        ),
+        last_month_orders AS (
+            SELECT id
+            FROM orders
+            WHERE created_at >= date_trunc('month', current_date) - INTERVAL '1 month'
+              AND created_at < date_trunc('month', current_date)
+        )
+        SELECT
+            p.name AS product_name,
+            ch.root_name AS category_lvl1,
+            SUM(oi.quantity) AS total_sold
+        FROM order_items AS oi
+        JOIN last_month_orders AS o ON oi.order_id = o.id
+        JOIN products AS p ON p.id = oi.product_id
+        JOIN category_hierarchy AS ch ON ch.id = p.category_id
+        GROUP BY p.name, ch.root_name
+        ORDER BY total_sold DESC
+        LIMIT 5
+    """,
+    # 2.3.2 вариант для дерева глубиной <= 2
+    "top5_last_month_parent_join": """
+        SELECT
+            p.name AS product_name,
+            COALESCE(parent.name, c.name) AS category_lvl1,
+            SUM(oi.quantity) AS total_sold
+        FROM order_items AS oi
+        JOIN orders AS o ON oi.order_id = o.id
+        JOIN products AS p ON p.id = oi.product_id
+        JOIN categories AS c ON c.id = p.category_id
+        LEFT JOIN categories AS parent ON parent.id = c.parent_id
+        WHERE o.created_at >= date_trunc('month', current_date) - INTERVAL '1 month'
+          AND o.created_at < date_trunc('month', current_date)
+        GROUP BY p.name, COALESCE(parent.name, c.name)
+        ORDER BY total_sold DESC
+        LIMIT 5
+    """,
+    # пачка массовой смены статуса (orders transition): должна идти по частичному
+    # индексу ix_orders_active_status_created_at без сортировки
+    "order_transition_batch": str(
+        OrderRepository.transition_batch(OrderStatus.DRAFT, chunk_size=1000)
+        .compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    ),
+}
+
+
+def run_query(conn, sql: str, repeat: int) -> dict:
+    conn.execute(text(sql)).fetchall()  # прогрев shared buffers
+
+    timings = []
+    rows = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = len(conn.execute(text(sql)).fetchall())
+        timings.append(time.perf_counter() - started)
+
+    plan = conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return {
+        "rows": rows,
+        "min_ms": min(timings) * 1000,
+        "median_ms": statistics.median(timings) * 1000,
+        "max_ms": max(timings) * 1000,
+        "plan": plan,
+    }
+
+
+def table_sizes(conn) -> dict[str, int]:
+    rows = conn.execute(text(
+        "SELECT relname, n_live_tup FROM pg_stat_user_tables ORDER BY relname"
+    ))
+    return {name: count for name, count in rows}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report query benchmark")
+    parser.add_argument("--database-url", default=Config.SQLALCHEMY_DATABASE_URI)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--label", default="")
+    parser.add_argument("--only", action="append", choices=sorted(REPORT_QUERIES),
+                        help="запустить только указанные запросы")
+    parser.add_argument("--output", help="куда записать JSON с результатами")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url, future=True)
+    if engine.dialect.name != "postgresql":
+        parser.error("report queries and EXPLAIN (ANALYZE, BUFFERS) require PostgreSQL")
+
+    result = {
+        "label": args.label,
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "repeat": args.repeat,
+        "queries": {},
+    }
+    with engine.connect() as conn:
+        result["server_version"] = conn.execute(text("SHOW server_version")).scalar_one()
+        result["table_sizes"] = table_sizes(conn)
+        for name, sql in REPORT_QUERIES.items():
+            if args.only and name not in args.only:
+                continue
+            stats = run_query(conn, sql, args.repeat)
+            result["queries"][name] = stats
+            print(f"{name:<30} rows={stats['rows']:<8} "
+                  f"min={stats['min_ms']:9.1f} ms  median={stats['median_ms']:9.1f} ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2, default=str)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""
+Генератор синтетического набора данных для нагрузочной проверки отчётов.
+
+Заполняет categories, products, clients, orders и order_items заданного
+масштаба и формы:
+  - дерево категорий заданной глубины и ветвистости;
+  - популярность товаров по закону Ципфа;
+  - даты заказов, равномерно распределённые по последним N месяцам.
+
+Загрузка идёт пачками мимо ORM: в PostgreSQL — через COPY, в остальных
+СУБД — через executemany Core-insert. Идентификаторы назначаются
+генератором, после загрузки последовательности PostgreSQL сдвигаются.
+
+Запуск (БД берётся из SQLALCHEMY_DATABASE_URI):
+    python -m benchmarks.dataset --order-lines 10000000 --truncate
+"""
+import argparse
+import bisect
+import csv
+import io
+import itertools
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+
+from src.config import Config
+from src.models import Base, OrderStatus
+
+# порядок загрузки совпадает с порядком внешних ключей
+TABLES = ("categories", "products", "clients", "orders", "order_items")
+
+ORDER_STATUS_WEIGHTS = {
+    OrderStatus.DRAFT: 10,
+    OrderStatus.CONFIRMED: 10,
+    OrderStatus.SHIPPED: 10,
+    OrderStatus.COMPLETED: 65,
+    OrderStatus.CANCELLED: 5,
+}
+
+
+@dataclass
+class DatasetShape:
+    """Масштаб и форма набора данных."""
+    order_lines: int = 100_000
+    lines_per_order: int = 4
+    products: int = 10_000
+    clients: int = 10_000
+    category_roots: int = 10
+    category_depth: int = 3
+    category_fanout: int = 5
+    zipf_s: float = 1.1
+    months: int = 6
+    seed: int = 42
+
+
+def generate_categories(shape: DatasetShape):
+    """Дерево категорий обходом в ширину: (id, name, parent_id, depth)."""
+    next_id = itertools.count(1)
+    level = []
+    for i in range(shape.category_roots):
+        level.append((next(next_id), f"Category {i + 1}", None, 1))
+    yield from level
+
+    for depth in range(2, shape.category_depth + 1):
+        children = []
+        for parent_id, parent_name, _, _ in level:
+            for i in range(shape.category_fanout):
+                children.append((next(next_id), f"{parent_name}.{i + 1}", parent_id, depth))
+        yield from children
+        level = children
+
+
+def generate_products(shape: DatasetShape, leaf_category_ids: list[int], rnd: random.Random):
+    """Товары: (id, sku, name, category_id, price, stock)."""
+    for product_id in range(1, shape.products + 1):
+        price = Decimal(rnd.randint(100, 1_000_000)) / 100
+        yield (
+            product_id,
+            f"SKU-{product_id:08d}",
+            f"Product {product_id}",
+            rnd.choice(leaf_category_ids),
+            price,
+            rnd.randint(0, 10_000),
+        )
+
+
+def generate_clients(shape: DatasetShape):
+    """Клиенты: (id, name, address)."""
+    for client_id in range(1, shape.clients + 1):
+        yield client_id, f"Client {client_id}", f"Street {client_id % 997}, {client_id}"
+
+
+class ZipfSampler:
+    """
+    Выбор product_id с вероятностью ~ 1 / rank^s.
+
+    Ранги перемешаны относительно id, чтобы популярные товары не совпадали
+    с первыми строками таблицы и её физическим порядком.
+    """
+
+    def __init__(self, n: int, s: float, rnd: random.Random):
+        self._rnd = rnd
+        self._ids = list(range(1, n + 1))
+        rnd.shuffle(self._ids)
+        self._cum_weights = list(itertools.accumulate(1 / rank ** s for rank in range(1, n + 1)))
+        self._total = self._cum_weights[-1]
+
+    def sample(self) -> int:
+        rank = bisect.bisect(self._cum_weights, self._rnd.random() * self._total)
+        return self._ids[min(rank, len(self._ids) - 1)]
+
+    def sample_distinct(self, k: int) -> list[int]:
+        """k различных товаров (UNIQUE(order_id, product_id))."""
+        k = min(k, len(self._ids))
+        chosen = dict.fromkeys(self.sample() for _ in range(k))
+        while len(chosen) < k:
+            chosen[self.sample()] = None
+        return list(chosen)
+
+
+def generate_orders_and_items(shape: DatasetShape, prices: dict[int, Decimal],
+                              rnd: random.Random, now: datetime):
+    """
+    Заказы и позиции вместе, чтобы позиции получили дату своего заказа.
+    Отдаёт ("order", row) и ("item", row).
+    """
+    sampler = ZipfSampler(shape.products, shape.zipf_s, rnd)
+    statuses = list(ORDER_STATUS_WEIGHTS)
+    status_weights = list(ORDER_STATUS_WEIGHTS.values())
+    span = timedelta(days=30 * shape.months).total_seconds()
+    item_ids = itertools.count(1)
+    lines_left = shape.order_lines
+
+    for order_id in itertools.count(1):
+        if lines_left <= 0:
+            return
+        created_at = now - timedelta(seconds=rnd.random() * span)
+        status = rnd.choices(statuses, status_weights)[0]
+        yield "order", (order_id, rnd.randint(1, shape.clients), status, created_at)
+
+        lines = min(rnd.randint(1, 2 * shape.lines_per_order - 1), lines_left)
+        lines_left -= lines
+        for product_id in sampler.sample_distinct(lines):
+            yield "item", (next(item_ids), order_id, product_id,
+                           rnd.randint(1, 5), prices[product_id], created_at)
+
+
+class BulkLoader:
+    """Пачечная загрузка строк: COPY для PostgreSQL, executemany иначе."""
+
+    def __init__(self, conn: Connection, chunk_size: int = 50_000):
+        self.conn = conn
+        self.chunk_size = chunk_size
+        self.is_postgres = conn.dialect.name == "postgresql"
+        self.loaded = dict.fromkeys(TABLES, 0)
+
+    def load(self, table: str, columns: tuple[str, ...], rows):
+        rows = iter(rows)
+        while chunk := list(itertools.islice(rows, self.chunk_size)):
+            self.write_chunk(table, columns, chunk)
+
+    def write_chunk(self, table: str, columns: tuple[str, ...], chunk: list[tuple]):
+        if self.is_postgres:
+            buf = io.StringIO()
+            csv.writer(buf).writerows(chunk)
+            buf.seek(0)
+            cursor = self.conn.connection.dbapi_connection.cursor()
+            try:
+                cursor.copy_expert(
+                    f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buf
+                )
+            finally:
+                cursor.close()
+        else:
+            self.conn.execute(
+                Base.metadata.tables[table].insert(),
+                [dict(zip(columns, row)) for row in chunk],
+            )
+        self.loaded[table] += len(chunk)
+
+    def reset_sequences(self):
+        if not self.is_postgres:
+            return
+        for table in TABLES:
+            self.conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+            ))
+
+
+def truncate(conn: Connection):
+    if conn.dialect.name == "postgresql":
+        conn.execute(text(f"TRUNCATE {', '.join(TABLES)} RESTART IDENTITY CASCADE"))
+    else:
+        for table in reversed(TABLES):
+            conn.execute(Base.metadata.tables[table].delete())
+
+
+def populate(conn: Connection, shape: DatasetShape, chunk_size: int = 50_000,
+             now: datetime | None = None) -> dict[str, int]:
+    """Заполняет пустую схему набором данных заданной формы."""
+    rnd = random.Random(shape.seed)
+    now = now or datetime.now(timezone.utc)
+    loader = BulkLoader(conn, chunk_size)
+
+    categories = list(generate_categories(shape))
+    loader.load("categories", ("id", "name", "parent_id"), (row[:3] for row in categories))
+    leaf_ids = [row[0] for row in categories if row[3] == shape.category_depth]
+
+    products = list(generate_products(shape, leaf_ids, rnd))
+    loader.load("products", ("id", "sku", "name", "category_id", "price", "stock"), products)
+    prices = {row[0]: row[4] for row in products}
+    del products
+
+    loader.load("clients", ("id", "name", "address"), generate_clients(shape))
+
+    # orders и order_items идут одним потоком: позиции пишем только
+    # после того, как их заказы уже загружены (FK order_items.order_id)
+    order_columns = ("id", "client_id", "status", "created_at")
+    item_columns = ("id", "order_id", "product_id", "quantity", "unit_price", "created_at")
+    orders, items = [], []
+    for kind, row in generate_orders_and_items(shape, prices, rnd, now):
+        if kind == "order":
+            orders.append(row)
+        else:
+            items.append(row)
+        if len(items) >= chunk_size:
+            loader.write_chunk("orders", order_columns, orders)
+            loader.write_chunk("order_items", item_columns, items)
+            orders, items = [], []
+    if orders:
+        loader.write_chunk("orders", order_columns, orders)
+    if items:
+        loader.write_chunk("order_items", item_columns, items)
+
+    loader.reset_sequences()
+    return loader.loaded
+
+
+def main():
+    defaults = DatasetShape()
+    parser = argparse.ArgumentParser(description="Synthetic dataset generator")
+    parser.add_argument("--database-url", default=Config.SQLALCHEMY_DATABASE_URI)
+    parser.add_argument("--order-lines", type=int, default=defaults.order_lines)
+    parser.add_argument("--lines-per-order", type=int, default=defaults.lines_per_order)
+    parser.add_argument("--products", type=int, default=defaults.products)
+    parser.add_argument("--clients", type=int, default=defaults.clients)
+    parser.add_argument("--category-roots", type=int, default=defaults.category_roots)
+    parser.add_argument("--category-depth", type=int, default=defaults.category_depth)
+    parser.add_argument("--category-fanout", type=int, default=defaults.category_fanout)
+    parser.add_argument("--zipf-s", type=float, default=defaults.zipf_s)
+    parser.add_argument("--months", type=int, default=defaults.months)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument("--truncate", action="store_true",
+                        help="очистить таблицы перед загрузкой")
+    args = parser.parse_args()
+
+    shape = DatasetShape(
+        order_lines=args.order_lines,
+        lines_per_order=args.lines_per_order,
+        products=args.products,
+        clients=args.clients,
+        category_roots=args.category_roots,
+        category_depth=args.category_depth,
+        category_fanout=args.category_fanout,
+        zipf_s=args.zipf_s,
+        months=args.months,
+        seed=args.seed,
+    )
+
+    engine = create_engine(args.database_url, future=True)
+    started = time.monotonic()
+    with engine.begin() as conn:
+        if args.truncate:
+            truncate(conn)
+        loaded = populate(conn, shape, args.chunk_size)
+        if conn.dialect.name == "postgresql":
+            conn.execute(text("ANALYZE"))
+
+    for table, count in loaded.items():
+        print(f"{table:<12} {count:>12,}")
+    print(f"loaded in {time.monotonic() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
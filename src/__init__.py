@@ -6,7 +6,8 @@ from flasgger import Swagger
 from .config import Config
 from .extensions import engine
 from .models import Base
-from .api import orders_bp
+from .api import orders_bp, products_bp
+from .cli import orders_cli
 
 def create_app():
     """
@@ -40,5 +41,9 @@ def create_app():
 
     # Регистрация роутов
     app.register_blueprint(orders_bp)
+    app.register_blueprint(products_bp)
+
+    # CLI-команды (flask --app src.app orders ...)
+    app.cli.add_command(orders_cli)
 
     return app
@@ -1 +1,2 @@
-from .orders import orders_bp
\ No newline at end of file
+from .orders import orders_bp
+from .products import products_bp
@@ -1,10 +1,18 @@
+from datetime import datetime
+
 from flask import Blueprint, request, jsonify
 
+from src.extensions import admission, catalog_cache
 from src.unit_of_work import SqlAlchemyUnitOfWork
 from src.services import (OrderService,
                           OrderNotFoundError,
                           ProductNotFoundError,
-                          OutOfStockError)
+                          OutOfStockError,
+                          OrderNotEditableError,
+                          InvalidStatusTransitionError,
+                          UnknownOrderStatusError,
+                          AdmissionQueueFullError,
+                          AdmissionRejectedError)
 
 orders_bp = Blueprint("orders", __name__, url_prefix="/api/orders")
 
@@ -27,6 +35,38 @@ def ping():
     return jsonify({"ping": "pong"})
 
 
+@orders_bp.route("/admission-metrics", methods=["GET"])
+def admission_metrics():
+    """
+        Admission control metrics for the add-item write path
+        ---
+        tags:
+          - Metrics
+        responses:
+          200:
+            description: Counters and current per-product queues
+            schema:
+              type: object
+              properties:
+                admitted:
+                  type: integer
+                rejected_queue_full:
+                  type: integer
+                rejected_timeout:
+                  type: integer
+                in_flight:
+                  type: integer
+                waiting:
+                  type: integer
+                max_waiting:
+                  type: integer
+                queue_depth_limit:
+                  type: integer
+                products:
+                  type: object
+        """
+    return jsonify(admission.metrics())
+
 
 @orders_bp.route("/<int:order_id>/items", methods=["POST"])
 def add_item(order_id):
@@ -96,13 +136,17 @@ def add_item(order_id):
                   type: string
                   example: "Order not found"
           409:
-            description: Conflict - product out of stock
+            description: Conflict - product out of stock or order is completed/cancelled
             schema:
               type: object
               properties:
                 error:
                   type: string
                   example: "Product out of stock"
+          429:
+            description: Too many pending requests for this product, see Retry-After header
+          503:
+            description: Timed out waiting for this product, see Retry-After header
           500:
             description: Internal server error
         """
@@ -114,27 +158,211 @@ def add_item(order_id):
         return jsonify({"error": "product_id and quantity required"}), 400
     try:
         qty = int(qty)
-    except ValueError:
+    except (TypeError, ValueError):
         return jsonify({"error": "quantity must be integer"}), 400
+    try:
+        product_id = int(product_id)
+    except (TypeError, ValueError):
+        return jsonify({"error": "product_id must be integer"}), 400
+
+    try:
+        with admission.acquire(product_id):
+            return _add_item(order_id, product_id, qty)
+    except AdmissionRejectedError as e:
+        status = 429 if isinstance(e, AdmissionQueueFullError) else 503
+        response = jsonify({"error": str(e)})
+        response.headers["Retry-After"] = str(e.retry_after)
+        return response, status
+
 
+def _add_item(order_id: int, product_id: int, qty: int):
     with SqlAlchemyUnitOfWork() as uow:
-        service = OrderService(uow)
+        service = OrderService(uow, catalog_cache)
         try:
             item = service.add_item(order_id, product_id, qty)
-            uow.commit()
-            return jsonify({
+            # Ответ собираем до commit: после него expire_on_commit сбросит атрибуты item.
+            # Сбой commit ловится ниже; __exit__ повторно не коммитит закрытую транзакцию.
+            payload = {
                 "id": item.id,
                 "order_id": item.order_id,
                 "product_id": item.product_id,
                 "quantity": item.quantity,
                 "unit_price": str(item.unit_price),
-            }), 201
+            }
+            uow.commit()
+            return jsonify(payload), 201
         except OrderNotFoundError as e:
+            uow.rollback()
             return jsonify({"error": str(e)}), 404
         except ProductNotFoundError as e:
+            uow.rollback()
             return jsonify({"error": str(e)}), 404
-        except OutOfStockError as e:
+        except (OutOfStockError, OrderNotEditableError) as e:
+            uow.rollback()
+            return jsonify({"error": str(e)}), 409
+        except Exception as e:
+            uow.rollback()
+            return jsonify({"error": f"Internal error: {e}"}), 500
+
+
+@orders_bp.route("/<int:order_id>/status", methods=["POST"])
+def change_status(order_id):
+    """
+        Change order status
+        ---
+        tags:
+          - Order Status
+        parameters:
+          - name: order_id
+            in: path
+            type: integer
+            required: true
+            description: ID of the order
+          - name: body
+            in: body
+            required: true
+            schema:
+              type: object
+              required:
+                - status
+              properties:
+                status:
+                  type: string
+                  enum: [draft, confirmed, shipped, completed, cancelled]
+                  example: confirmed
+        responses:
+          200:
+            description: Status changed
+            schema:
+              type: object
+              properties:
+                id:
+                  type: integer
+                status:
+                  type: string
+          400:
+            description: Bad request - status missing or unknown
+          404:
+            description: Order not found
+          409:
+            description: Transition is not allowed from the current status
+          500:
+            description: Internal server error
+        """
+    data = request.get_json(force=True)
+    to_status = data.get("status")
+    if not to_status:
+        return jsonify({"error": "status required"}), 400
+
+    with SqlAlchemyUnitOfWork() as uow:
+        try:
+            order = OrderService(uow).change_status(order_id, to_status)
+            payload = {"id": order.id, "status": order.status}
+            uow.commit()
+            return jsonify(payload)
+        except OrderNotFoundError as e:
+            uow.rollback()
+            return jsonify({"error": str(e)}), 404
+        except UnknownOrderStatusError as e:
+            uow.rollback()
+            return jsonify({"error": str(e)}), 400
+        except InvalidStatusTransitionError as e:
+            uow.rollback()
+            return jsonify({"error": str(e)}), 409
+        except Exception as e:
+            uow.rollback()
+            return jsonify({"error": f"Internal error: {e}"}), 500
+
+
+@orders_bp.route("/transitions", methods=["POST"])
+def bulk_transition():
+    """
+        Bulk order status transition
+        ---
+        tags:
+          - Order Status
+        parameters:
+          - name: body
+            in: body
+            required: true
+            schema:
+              type: object
+              required:
+                - from_status
+                - to_status
+              properties:
+                from_status:
+                  type: string
+                  example: draft
+                to_status:
+                  type: string
+                  example: cancelled
+                created_before:
+                  type: string
+                  format: date-time
+                  description: Only orders created before this moment (ISO 8601 with a UTC offset)
+                  example: "2026-01-01T00:00:00+00:00"
+                client_id:
+                  type: integer
+                chunk_size:
+                  type: integer
+                  description: Orders per UPDATE ... RETURNING batch (committed separately)
+                  example: 1000
+                limit:
+                  type: integer
+                  description: Maximum number of orders to transition
+        responses:
+          200:
+            description: Number of transitioned orders
+            schema:
+              type: object
+              properties:
+                transitioned:
+                  type: integer
+          400:
+            description: Bad request - missing or invalid parameters, unknown status
+          409:
+            description: Transition is not allowed
+          500:
+            description: Internal server error
+        """
+    data = request.get_json(force=True)
+    from_status = data.get("from_status")
+    to_status = data.get("to_status")
+    if not from_status or not to_status:
+        return jsonify({"error": "from_status and to_status required"}), 400
+
+    try:
+        created_before = data.get("created_before")
+        if created_before is not None:
+            created_before = datetime.fromisoformat(created_before)
+            # наивное время сравнивалось бы с timestamptz в зоне сервера БД
+            if created_before.utcoffset() is None:
+                return jsonify({"error": "created_before must include a UTC offset"}), 400
+        chunk_size = int(data.get("chunk_size", 1000))
+        limit = data.get("limit")
+        limit = int(limit) if limit is not None else None
+        client_id = data.get("client_id")
+        client_id = int(client_id) if client_id is not None else None
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": f"Invalid parameter: {e}"}), 400
+
+    with SqlAlchemyUnitOfWork() as uow:
+        try:
+            transitioned = OrderService(uow).bulk_transition(
+                from_status, to_status,
+                created_before=created_before,
+                client_id=client_id,
+                chunk_size=chunk_size,
+                limit=limit,
+            )
+            uow.commit()
+            return jsonify({"transitioned": transitioned})
+        except InvalidStatusTransitionError as e:
             return jsonify({"error": str(e)}), 409
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         except Exception as e:
+            # уже закоммиченные пачки остаются переведёнными, откатывается только текущая
             uow.rollback()
             return jsonify({"error": f"Internal error: {e}"}), 500
\ No newline at end of file
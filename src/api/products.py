@@ -0,0 +1,148 @@
+from flask import Blueprint, request, jsonify
+from sqlalchemy.exc import IntegrityError
+
+from src.extensions import catalog_cache
+from src.unit_of_work import SqlAlchemyUnitOfWork
+from src.services import ProductService, ProductNotFoundError
+
+products_bp = Blueprint("products", __name__, url_prefix="/api/products")
+
+
+def product_to_json(info):
+    return {
+        "id": info.id,
+        "sku": info.sku,
+        "name": info.name,
+        "category_id": info.category_id,
+        "price": str(info.price),
+    }
+
+
+@products_bp.route("/cache-metrics", methods=["GET"])
+def cache_metrics():
+    """
+        Catalog cache metrics
+        ---
+        tags:
+          - Metrics
+        responses:
+          200:
+            description: Hit/miss counters and cache size
+            schema:
+              type: object
+              properties:
+                hits:
+                  type: integer
+                misses:
+                  type: integer
+                hit_ratio:
+                  type: number
+                evictions:
+                  type: integer
+                invalidations:
+                  type: integer
+                size:
+                  type: integer
+                max_size:
+                  type: integer
+                ttl:
+                  type: number
+        """
+    return jsonify(catalog_cache.metrics())
+
+
+@products_bp.route("/<int:product_id>", methods=["GET"])
+def get_product(product_id):
+    """
+        Get product catalog attributes (served from the catalog cache)
+        ---
+        tags:
+          - Products
+        parameters:
+          - name: product_id
+            in: path
+            type: integer
+            required: true
+            description: ID of the product
+        responses:
+          200:
+            description: Product attributes, stock is not included
+            schema:
+              type: object
+              properties:
+                id:
+                  type: integer
+                sku:
+                  type: string
+                name:
+                  type: string
+                category_id:
+                  type: integer
+                price:
+                  type: string
+                  description: Price as string (decimal)
+          404:
+            description: Product not found
+        """
+    with SqlAlchemyUnitOfWork() as uow:
+        info = ProductService(uow, catalog_cache).get_info(product_id)
+        if info is None:
+            return jsonify({"error": f"Product {product_id} not found"}), 404
+        return jsonify(product_to_json(info))
+
+
+@products_bp.route("/<int:product_id>", methods=["PATCH"])
+def update_product(product_id):
+    """
+        Update product catalog attributes
+        ---
+        tags:
+          - Products
+        parameters:
+          - name: product_id
+            in: path
+            type: integer
+            required: true
+            description: ID of the product
+          - name: body
+            in: body
+            required: true
+            schema:
+              type: object
+              properties:
+                sku:
+                  type: string
+                name:
+                  type: string
+                category_id:
+                  type: integer
+                price:
+                  type: string
+                  example: "199.90"
+        responses:
+          200:
+            description: Updated product attributes
+          400:
+            description: Bad request - unknown field or invalid value
+          404:
+            description: Product not found
+        """
+    data = request.get_json(force=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "JSON object required"}), 400
+
+    with SqlAlchemyUnitOfWork() as uow:
+        service = ProductService(uow, catalog_cache)
+        try:
+            info = service.update(product_id, data)
+            return jsonify(product_to_json(info))
+        except ValueError as e:
+            uow.rollback()
+            return jsonify({"error": str(e)}), 400
+        except ProductNotFoundError as e:
+            uow.rollback()
+            return jsonify({"error": str(e)}), 404
+        except IntegrityError:
+            # например, category_id ссылается на несуществующую категорию
+            uow.rollback()
+            return jsonify({"error": "Update violates a database constraint"}), 400
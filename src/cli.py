@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta, timezone
+
+import click
+from flask.cli import AppGroup
+
+from src.models import OrderStatus
+from src.services import OrderService, InvalidStatusTransitionError, UnknownOrderStatusError
+from src.unit_of_work import SqlAlchemyUnitOfWork
+
+orders_cli = AppGroup("orders", help="Обслуживание заказов.")
+
+
+@orders_cli.command("transition")
+@click.option("--from", "from_status", required=True, type=click.Choice(OrderStatus.ALL))
+@click.option("--to", "to_status", required=True, type=click.Choice(OrderStatus.ALL))
+@click.option("--older-than-hours", type=float, default=None,
+              help="Только заказы, созданные раньше, чем N часов назад.")
+@click.option("--client-id", type=int, default=None)
+@click.option("--chunk-size", type=int, default=1000, show_default=True)
+@click.option("--limit", type=int, default=None, help="Не больше N заказов за запуск.")
+def transition(from_status, to_status, older_than_hours, client_id, chunk_size, limit):
+    """
+    Массовый перевод заказов между статусами.
+
+    Пример — отменить черновики старше двух суток и вернуть остаток на склад:
+
+    \b
+        flask --app src.app orders transition --from draft --to cancelled --older-than-hours 48
+    """
+    created_before = None
+    if older_than_hours is not None:
+        created_before = datetime.now(timezone.utc) - timedelta(hours=older_than_hours)
+
+    with SqlAlchemyUnitOfWork() as uow:
+        try:
+            transitioned = OrderService(uow).bulk_transition(
+                from_status, to_status,
+                created_before=created_before,
+                client_id=client_id,
+                chunk_size=chunk_size,
+                limit=limit,
+            )
+        except (InvalidStatusTransitionError, UnknownOrderStatusError) as e:
+            raise click.ClickException(str(e))
+
+    click.echo(f"{transitioned} orders moved from {from_status} to {to_status}")
@@ -19,3 +19,13 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = str_to_bool(os.getenv('SQLALCHEMY_ECHO'))
     DEBUG = str_to_bool(os.getenv('FLASK_DEBUG'))
+
+    # Ограничение конкурентности добавления товара в заказ (по product_id)
+    ADMISSION_MAX_CONCURRENCY = int(os.getenv('ADMISSION_MAX_CONCURRENCY', '1'))
+    ADMISSION_QUEUE_DEPTH = int(os.getenv('ADMISSION_QUEUE_DEPTH', '8'))
+    ADMISSION_WAIT_TIMEOUT = float(os.getenv('ADMISSION_WAIT_TIMEOUT', '0.5'))
+    ADMISSION_RETRY_AFTER = int(os.getenv('ADMISSION_RETRY_AFTER', '1'))
+
+    # Кэш атрибутов каталога (name, price, category, sku); TTL — граница устаревания, сек
+    CATALOG_CACHE_MAX_SIZE = int(os.getenv('CATALOG_CACHE_MAX_SIZE', '10000'))
+    CATALOG_CACHE_TTL = float(os.getenv('CATALOG_CACHE_TTL', '30'))
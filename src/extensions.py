@@ -2,6 +2,8 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from .config import Config
 from .models import Base  # импортируем Base с нашими моделями
+from .services.admission import ProductAdmissionController
+from .services.catalog_cache import ProductCatalogCache
 
 # движок
 engine = create_engine(
@@ -16,4 +18,18 @@ SessionLocal = sessionmaker(
     autoflush=False,
     autocommit=False,
     future=True
-)
\ No newline at end of file
+)
+
+# ограничитель нагрузки на запись по товару
+admission = ProductAdmissionController(
+    max_concurrency=Config.ADMISSION_MAX_CONCURRENCY,
+    queue_depth=Config.ADMISSION_QUEUE_DEPTH,
+    wait_timeout=Config.ADMISSION_WAIT_TIMEOUT,
+    retry_after=Config.ADMISSION_RETRY_AFTER,
+)
+
+# кэш атрибутов каталога; остаток всегда читается из БД
+catalog_cache = ProductCatalogCache(
+    max_size=Config.CATALOG_CACHE_MAX_SIZE,
+    ttl=Config.CATALOG_CACHE_TTL,
+)
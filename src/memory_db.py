@@ -0,0 +1,23 @@
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from .models import Base
+
+
+def make_memory_session_factory() -> sessionmaker:
+    """
+    SQLite в памяти с одним соединением на всех (StaticPool) и созданной схемой.
+    Используется тестами и микробенчмарками, которым не нужен PostgreSQL.
+    FOR UPDATE диалект SQLite просто не рендерит. Внешние ключи включены,
+    как в PostgreSQL.
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    event.listen(engine, "connect",
+                 lambda dbapi_connection, _: dbapi_connection.execute("PRAGMA foreign_keys=ON"))
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine, autoflush=False, future=True)
@@ -2,5 +2,5 @@ from .base import Base
 from .category import Category
 from .product import Product
 from .client import Client
-from .order import Order
+from .order import Order, OrderStatus
 from .order_item import OrderItem
\ No newline at end of file
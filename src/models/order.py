@@ -1,8 +1,21 @@
-from sqlalchemy import Column, Integer, Text, ForeignKey, TIMESTAMP, func
+from sqlalchemy import Column, Integer, Text, ForeignKey, TIMESTAMP, Index, func
 from sqlalchemy.orm import relationship
 from .base import Base
 
 
+class OrderStatus:
+    """Допустимые статусы заказа. Переходы между ними — в src.services.order_status."""
+    DRAFT = "draft"
+    CONFIRMED = "confirmed"
+    SHIPPED = "shipped"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+    ALL = (DRAFT, CONFIRMED, SHIPPED, COMPLETED, CANCELLED)
+    FINAL = (COMPLETED, CANCELLED)
+    ACTIVE = (DRAFT, CONFIRMED, SHIPPED)
+
+
 class Order(Base):
     __tablename__ = "orders"
 
@@ -10,10 +23,20 @@ class Order(Base):
     client_id = Column(Integer, ForeignKey("clients.id"))
     client = relationship("Client")
 
-    status = Column(Text, nullable=False, default="draft")
+    status = Column(Text, nullable=False, default=OrderStatus.DRAFT)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
     items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # фоновые задачи (истечение черновиков, подтверждение оплаченных)
+        # ищут только живые заказы — завершённые в индекс не попадают
+        Index(
+            "ix_orders_active_status_created_at",
+            "status", "created_at", "id",
+            postgresql_where=status.in_(OrderStatus.ACTIVE),
+        ),
+    )
+
     def __repr__(self):
-        return f"<Order id={self.id} client_id={self.client_id} status={self.status}>"
\ No newline at end of file
+        return f"<Order id={self.id} client_id={self.client_id} status={self.status}>"
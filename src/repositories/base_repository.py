@@ -1,6 +1,6 @@
 from typing import TypeVar, Generic, Type
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, lambda_stmt
 
 T = TypeVar("T")
 
@@ -15,7 +15,10 @@ class BaseRepository(Generic[T]):
         return self.session.get(self.model, id_)
 
     def get_for_update(self, id_: int) -> T | None:
-        stmt = select(self.model).where(self.model.id == id_).with_for_update()
+        # lambda_stmt кэширует построенный и скомпилированный запрос
+        # по месту вызова и модели, id_ уходит в bind-параметр.
+        model = self.model
+        stmt = lambda_stmt(lambda: select(model).where(model.id == id_).with_for_update())
         return self.session.execute(stmt).scalar_one_or_none()
 
     def list_all(self) -> list[T]:
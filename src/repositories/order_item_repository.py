@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import select, lambda_stmt
 from src.models import OrderItem
 from src.repositories.base_repository import BaseRepository
 
@@ -9,8 +9,8 @@ class OrderItemRepository(BaseRepository[OrderItem]):
         super().__init__(OrderItem, session)
 
     def get_by_order_and_product(self, order_id: int, product_id: int) -> OrderItem | None:
-        stmt = (
-            select(OrderItem)
+        stmt = lambda_stmt(
+            lambda: select(OrderItem)
             .where(OrderItem.order_id == order_id, OrderItem.product_id == product_id)
             .with_for_update()
         )
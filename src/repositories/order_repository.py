@@ -1,4 +1,6 @@
-from sqlalchemy import select
+from datetime import datetime
+
+from sqlalchemy import select, update
 from src.models import Order
 from src.repositories.base_repository import BaseRepository
 
@@ -10,4 +12,46 @@ class OrderRepository(BaseRepository[Order]):
 
     def get_by_client(self, client_id: int):
         stmt = select(Order).where(Order.client_id == client_id)
-        return self.session.scalars(stmt).all()
\ No newline at end of file
+        return self.session.scalars(stmt).all()
+
+    @staticmethod
+    def transition_batch(from_status: str, chunk_size: int,
+                         created_before: datetime | None = None,
+                         client_id: int | None = None):
+        """
+            Выборка очередной пачки заказов для перевода статуса.
+            Порядок (created_at, id) совпадает с частичным индексом
+            ix_orders_active_status_created_at, поэтому каждая пачка читает
+            только начало диапазона живых заказов нужного статуса.
+        """
+        batch = (
+            select(Order.id)
+            .where(Order.status == from_status)
+            .order_by(Order.created_at, Order.id)
+            .limit(chunk_size)
+            .with_for_update(skip_locked=True)
+        )
+        if created_before is not None:
+            batch = batch.where(Order.created_at < created_before)
+        if client_id is not None:
+            batch = batch.where(Order.client_id == client_id)
+        return batch
+
+    def transition_chunk(self, from_status: str, to_status: str, chunk_size: int,
+                         created_before: datetime | None = None,
+                         client_id: int | None = None) -> list[int]:
+        """
+            Переводит до chunk_size заказов из from_status в to_status одним
+            UPDATE ... RETURNING. Заказы, заблокированные другими транзакциями
+            (например, add_item), пропускаются (SKIP LOCKED) и попадут в
+            следующий запуск.
+        """
+        batch = self.transition_batch(from_status, chunk_size, created_before, client_id)
+        stmt = (
+            update(Order)
+            .where(Order.id.in_(batch), Order.status == from_status)
+            .values(status=to_status)
+            .returning(Order.id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(self.session.scalars(stmt))
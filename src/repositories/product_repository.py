@@ -1,5 +1,5 @@
-from sqlalchemy import select
-from src.models import Product
+from sqlalchemy import select, update, func, lambda_stmt
+from src.models import Product, OrderItem
 from src.repositories.base_repository import BaseRepository
 
 class ProductRepository(BaseRepository[Product]):
@@ -14,4 +14,62 @@ class ProductRepository(BaseRepository[Product]):
 
     def get_available(self):
         stmt = select(Product).where(Product.stock > 0)
-        return self.session.scalars(stmt).all()
\ No newline at end of file
+        return self.session.scalars(stmt).all()
+
+    def get_catalog_info(self, product_id: int):
+        """Атрибуты каталога (без остатка) одной строкой, без загрузки ORM-объекта."""
+        stmt = lambda_stmt(
+            lambda: select(Product.id, Product.sku, Product.name, Product.category_id, Product.price)
+            .where(Product.id == product_id)
+        )
+        return self.session.execute(stmt).one_or_none()
+
+    def get_stock_for_update(self, product_id: int) -> int | None:
+        """Блокирует строку товара и возвращает только остаток."""
+        stmt = lambda_stmt(
+            lambda: select(Product.stock).where(Product.id == product_id).with_for_update()
+        )
+        return self.session.execute(stmt).scalar_one_or_none()
+
+    def decrement_stock(self, product_id: int, quantity: int):
+        stmt = lambda_stmt(
+            lambda: update(Product)
+            .where(Product.id == product_id)
+            .values(stock=Product.stock - quantity)
+            .execution_options(synchronize_session=False)
+        )
+        self.session.execute(stmt)
+
+    @staticmethod
+    def lock_for_release(order_ids: list[int]):
+        """
+            Блокировка товаров из позиций заказов в порядке id.
+            UPDATE ... FROM берёт блокировки в порядке плана, и две отмены
+            с общими товарами могли бы взаимно заблокироваться.
+        """
+        return (
+            select(Product.id)
+            .where(Product.id.in_(
+                select(OrderItem.product_id).where(OrderItem.order_id.in_(order_ids))
+            ))
+            .order_by(Product.id)
+            .with_for_update()
+        )
+
+    def release_stock_for_orders(self, order_ids: list[int]):
+        """Возвращает на склад количество по всем позициям заказов одним UPDATE ... FROM."""
+        self.session.execute(self.lock_for_release(order_ids))
+
+        reserved = (
+            select(OrderItem.product_id, func.sum(OrderItem.quantity).label("quantity"))
+            .where(OrderItem.order_id.in_(order_ids))
+            .group_by(OrderItem.product_id)
+            .subquery()
+        )
+        stmt = (
+            update(Product)
+            .where(Product.id == reserved.c.product_id)
+            .values(stock=Product.stock + reserved.c.quantity)
+            .execution_options(synchronize_session=False)
+        )
+        self.session.execute(stmt)
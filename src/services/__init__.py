@@ -1,4 +1,12 @@
 from .order_service import OrderService
 from .order_service import (OrderNotFoundError,
                             ProductNotFoundError,
-                            OutOfStockError)
\ No newline at end of file
+                            OutOfStockError,
+                            OrderNotEditableError)
+from .order_status import InvalidStatusTransitionError, UnknownOrderStatusError
+from .product_service import ProductService
+from .catalog_cache import ProductCatalogCache, ProductInfo
+from .admission import (ProductAdmissionController,
+                        AdmissionRejectedError,
+                        AdmissionQueueFullError,
+                        AdmissionTimeoutError)
@@ -0,0 +1,128 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+class AdmissionRejectedError(Exception):
+    """Запрос отклонён ограничителем нагрузки"""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdmissionQueueFullError(AdmissionRejectedError):
+    """Очередь ожидания по товару заполнена"""
+    pass
+
+
+class AdmissionTimeoutError(AdmissionRejectedError):
+    """Не дождались свободного слота по товару"""
+    pass
+
+
+class _ProductSlot:
+    __slots__ = ("cond", "in_flight", "waiting")
+
+    def __init__(self, lock: threading.Lock):
+        self.cond = threading.Condition(lock)
+        self.in_flight = 0
+        self.waiting = 0
+
+
+class ProductAdmissionController:
+    """
+    Ограничитель конкурентности по product_id.
+
+    Для каждого товара одновременно выполняется не больше max_concurrency
+    запросов, ещё не больше queue_depth ждут своей очереди не дольше
+    wait_timeout секунд. Остальные отклоняются сразу, не занимая
+    соединение из пула и не вставая в очередь за блокировкой строки.
+    """
+
+    def __init__(self, max_concurrency: int = 1, queue_depth: int = 8,
+                 wait_timeout: float = 0.5, retry_after: int = 1):
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if queue_depth < 0:
+            raise ValueError("queue_depth must not be negative")
+
+        self.max_concurrency = max_concurrency
+        self.queue_depth = queue_depth
+        self.wait_timeout = wait_timeout
+        self.retry_after = retry_after
+
+        self._lock = threading.Lock()
+        self._slots: dict[int, _ProductSlot] = {}
+        self._admitted = 0
+        self._rejected_queue_full = 0
+        self._rejected_timeout = 0
+        self._max_waiting = 0
+
+    @contextmanager
+    def acquire(self, product_id: int):
+        self._enter(product_id)
+        try:
+            yield
+        finally:
+            self._leave(product_id)
+
+    def _enter(self, product_id: int):
+        with self._lock:
+            slot = self._slots.get(product_id)
+            if slot is None:
+                slot = self._slots[product_id] = _ProductSlot(self._lock)
+
+            if slot.in_flight >= self.max_concurrency:
+                if slot.waiting >= self.queue_depth:
+                    self._rejected_queue_full += 1
+                    raise AdmissionQueueFullError(
+                        f"Too many pending requests for product {product_id}",
+                        self.retry_after,
+                    )
+
+                slot.waiting += 1
+                self._max_waiting = max(self._max_waiting, slot.waiting)
+                deadline = time.monotonic() + self.wait_timeout
+                try:
+                    while slot.in_flight >= self.max_concurrency:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._rejected_timeout += 1
+                            raise AdmissionTimeoutError(
+                                f"Product {product_id} is busy, try again later",
+                                self.retry_after,
+                            )
+                        slot.cond.wait(remaining)
+                finally:
+                    slot.waiting -= 1
+
+            slot.in_flight += 1
+            self._admitted += 1
+
+    def _leave(self, product_id: int):
+        with self._lock:
+            slot = self._slots[product_id]
+            slot.in_flight -= 1
+            if slot.waiting:
+                slot.cond.notify()
+            elif slot.in_flight == 0:
+                # не держим записи по простаивающим товарам
+                del self._slots[product_id]
+
+    def metrics(self) -> dict:
+        """Снимок счётчиков и текущих очередей по товарам."""
+        with self._lock:
+            return {
+                "admitted": self._admitted,
+                "rejected_queue_full": self._rejected_queue_full,
+                "rejected_timeout": self._rejected_timeout,
+                "in_flight": sum(s.in_flight for s in self._slots.values()),
+                "waiting": sum(s.waiting for s in self._slots.values()),
+                "max_waiting": self._max_waiting,
+                "queue_depth_limit": self.queue_depth,
+                "products": {
+                    product_id: {"in_flight": s.in_flight, "waiting": s.waiting}
+                    for product_id, s in self._slots.items()
+                },
+            }
@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable
+
+
+@dataclass(frozen=True)
+class ProductInfo:
+    """Редко меняющиеся атрибуты товара. Остаток сюда не входит — он только в БД."""
+    id: int
+    sku: str | None
+    name: str
+    category_id: int | None
+    price: Decimal
+
+    @classmethod
+    def from_row(cls, row) -> "ProductInfo":
+        return cls(
+            id=row.id,
+            sku=row.sku,
+            name=row.name,
+            category_id=row.category_id,
+            price=row.price,
+        )
+
+
+class ProductCatalogCache:
+    """
+    Ограниченный LRU/TTL-кэш атрибутов товара по product_id.
+
+    Запись живёт не дольше ttl секунд — это верхняя граница устаревания,
+    если товар изменили в обход invalidate(). Изменения через приложение
+    сбрасывают запись явно. Счётчик поколений защищает от гонки, когда
+    загрузка старого значения завершается уже после invalidate():
+    такое значение не кладётся в кэш.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[int, tuple[ProductInfo, float]] = OrderedDict()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, product_id: int,
+            loader: Callable[[], ProductInfo | None]) -> ProductInfo | None:
+        """Возвращает атрибуты из кэша или загружает их через loader."""
+        with self._lock:
+            entry = self._entries.get(product_id)
+            if entry is not None:
+                info, expires_at = entry
+                if self._clock() < expires_at:
+                    self._entries.move_to_end(product_id)
+                    self._hits += 1
+                    return info
+                del self._entries[product_id]
+            self._misses += 1
+            generation = self._generation
+            loaded_at = self._clock()
+
+        # загрузка идёт без блокировки, чтобы не сериализовать чтения из БД
+        info = loader()
+        if info is None:
+            return None
+
+        with self._lock:
+            if self._generation == generation:
+                self._entries[product_id] = (info, loaded_at + self.ttl)
+                self._entries.move_to_end(product_id)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return info
+
+    def invalidate(self, product_id: int):
+        with self._lock:
+            self._entries.pop(product_id, None)
+            self._generation += 1
+            self._invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def metrics(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+            }
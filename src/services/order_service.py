@@ -1,4 +1,9 @@
-from src.models import OrderItem
+from datetime import datetime
+
+from src.models import Order, OrderItem, OrderStatus
+from src.services.catalog_cache import ProductCatalogCache
+from src.services.order_status import check_transition, RELEASES_STOCK
+from src.services.product_service import ProductService, ProductNotFoundError
 
 
 class OrderNotFoundError(Exception):
@@ -6,21 +11,23 @@ class OrderNotFoundError(Exception):
     pass
 
 
-class ProductNotFoundError(Exception):
-    """Товар не найден"""
+class OutOfStockError(Exception):
+    """Товара недостаточно на складе"""
     pass
 
 
-class OutOfStockError(Exception):
-    """Товара недостаточно на складе"""
+class OrderNotEditableError(Exception):
+    """Заказ в финальном статусе, менять позиции нельзя"""
     pass
 
 
 class OrderService:
     """Бизнес-логика заказов (независимая от SQLAlchemy)."""
 
-    def __init__(self, uow):
+    def __init__(self, uow, catalog: ProductCatalogCache | None = None):
         self.uow = uow
+        self.catalog = catalog
+        self.products = ProductService(uow, catalog)
 
     def add_item(self, order_id: int, product_id: int, quantity: int) -> OrderItem:
         """
@@ -35,12 +42,21 @@ class OrderService:
         order = self.uow.order_repo.get_for_update(order_id)
         if not order:
             raise OrderNotFoundError(f"Order {order_id} not found")
+        if order.status in OrderStatus.FINAL:
+            raise OrderNotEditableError(f"Order {order_id} is {order.status}")
 
-        product = self.uow.product_repo.get_for_update(product_id)
+        # имя и цена — из кэша каталога, блокируем и читаем из БД только остаток
+        product = self.products.get_info(product_id)
         if not product:
             raise ProductNotFoundError(f"Product {product_id} not found")
 
-        if product.stock < quantity:
+        stock = self.uow.product_repo.get_stock_for_update(product_id)
+        if stock is None:
+            if self.catalog is not None:
+                self.catalog.invalidate(product_id)
+            raise ProductNotFoundError(f"Product {product_id} not found")
+
+        if stock < quantity:
             raise OutOfStockError(f"Not enough stock for {product.name}")
 
         item = self.uow.item_repo.get_by_order_and_product(order_id, product_id)
@@ -56,8 +72,58 @@ class OrderService:
             )
             self.uow.item_repo.add(item)
 
-        product.stock -= quantity
-        self.uow.product_repo.save(product)
+        self.uow.product_repo.decrement_stock(product_id, quantity)
         self.uow.session.flush()
 
         return item
+
+    def change_status(self, order_id: int, to_status: str) -> Order:
+        """
+            Перевод одного заказа в новый статус по машине состояний.
+            При отмене остаток по позициям возвращается на склад.
+        """
+        order = self.uow.order_repo.get_for_update(order_id)
+        if not order:
+            raise OrderNotFoundError(f"Order {order_id} not found")
+
+        check_transition(order.status, to_status)
+        order.status = to_status
+        self.uow.order_repo.save(order)
+
+        if to_status in RELEASES_STOCK:
+            self.uow.product_repo.release_stock_for_orders([order_id])
+
+        return order
+
+    def bulk_transition(self, from_status: str, to_status: str,
+                        created_before: datetime | None = None,
+                        client_id: int | None = None,
+                        chunk_size: int = 1000,
+                        limit: int | None = None) -> int:
+        """
+            Массовый перевод заказов из from_status в to_status пачками по
+            chunk_size. Каждая пачка — один UPDATE ... RETURNING, возврат
+            остатка для отменённых и отдельный commit, чтобы не держать
+            долгие блокировки. Возвращает число переведённых заказов.
+        """
+        check_transition(from_status, to_status)
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        total = 0
+        while limit is None or total < limit:
+            size = chunk_size if limit is None else min(chunk_size, limit - total)
+            order_ids = self.uow.order_repo.transition_chunk(
+                from_status, to_status, size,
+                created_before=created_before,
+                client_id=client_id,
+            )
+            if not order_ids:
+                break
+
+            if to_status in RELEASES_STOCK:
+                self.uow.product_repo.release_stock_for_orders(order_ids)
+            self.uow.commit()
+            total += len(order_ids)
+
+        return total
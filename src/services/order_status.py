@@ -0,0 +1,38 @@
+from src.models import OrderStatus
+
+
+class InvalidStatusTransitionError(Exception):
+    """Недопустимый переход статуса заказа"""
+    pass
+
+
+class UnknownOrderStatusError(ValueError):
+    """Такого статуса заказа не существует"""
+    pass
+
+
+# Машина состояний заказа: из какого статуса куда можно перейти
+TRANSITIONS: dict[str, frozenset[str]] = {
+    OrderStatus.DRAFT: frozenset({OrderStatus.CONFIRMED, OrderStatus.CANCELLED}),
+    OrderStatus.CONFIRMED: frozenset({OrderStatus.SHIPPED, OrderStatus.CANCELLED}),
+    OrderStatus.SHIPPED: frozenset({OrderStatus.COMPLETED}),
+    OrderStatus.COMPLETED: frozenset(),
+    OrderStatus.CANCELLED: frozenset(),
+}
+
+# При переходе в эти статусы зарезервированный остаток возвращается на склад
+RELEASES_STOCK = frozenset({OrderStatus.CANCELLED})
+
+
+def check_transition(from_status: str, to_status: str):
+    """
+    Бросает UnknownOrderStatusError для несуществующего статуса
+    и InvalidStatusTransitionError, если переход не разрешён.
+    """
+    for status in (from_status, to_status):
+        if not isinstance(status, str) or status not in TRANSITIONS:
+            raise UnknownOrderStatusError(f"Unknown order status: {status}")
+    if to_status not in TRANSITIONS[from_status]:
+        raise InvalidStatusTransitionError(
+            f"Cannot change order status from {from_status} to {to_status}"
+        )
@@ -0,0 +1,87 @@
+from decimal import Decimal, InvalidOperation
+
+from src.services.catalog_cache import ProductCatalogCache, ProductInfo
+
+PRICE_QUANT = Decimal("0.01")
+
+
+class ProductNotFoundError(Exception):
+    """Товар не найден"""
+    pass
+
+
+class ProductService:
+    """Чтение и изменение атрибутов каталога с учётом кэша."""
+
+    UPDATABLE_FIELDS = ("sku", "name", "category_id", "price")
+
+    def __init__(self, uow, catalog: ProductCatalogCache | None = None):
+        self.uow = uow
+        self.catalog = catalog
+
+    def get_info(self, product_id: int) -> ProductInfo | None:
+        """Атрибуты товара из кэша каталога (если он подключён) или из БД."""
+        def load():
+            row = self.uow.product_repo.get_catalog_info(product_id)
+            return ProductInfo.from_row(row) if row else None
+
+        if self.catalog is None:
+            return load()
+        return self.catalog.get(product_id, load)
+
+    @classmethod
+    def validate_changes(cls, changes: dict) -> dict:
+        """Проверяет поля и приводит значения к виду, в котором они хранятся в БД."""
+        unknown = set(changes) - set(cls.UPDATABLE_FIELDS)
+        if unknown:
+            raise ValueError(f"Cannot update fields: {', '.join(sorted(unknown))}")
+
+        cleaned = dict(changes)
+        if "name" in cleaned:
+            name = cleaned["name"]
+            if not isinstance(name, str) or not name.strip():
+                raise ValueError("name must be a non-empty string")
+        if "sku" in cleaned and cleaned["sku"] is not None and not isinstance(cleaned["sku"], str):
+            raise ValueError("sku must be a string or null")
+        if "category_id" in cleaned:
+            category_id = cleaned["category_id"]
+            if category_id is not None and (isinstance(category_id, bool)
+                                            or not isinstance(category_id, int)):
+                raise ValueError("category_id must be an integer or null")
+        if "price" in cleaned:
+            cleaned["price"] = cls._parse_price(cleaned["price"])
+        return cleaned
+
+    @staticmethod
+    def _parse_price(value) -> Decimal:
+        if isinstance(value, bool) or not isinstance(value, (str, int, float, Decimal)):
+            raise ValueError("price must be a decimal number")
+        try:
+            price = Decimal(str(value))
+        except InvalidOperation:
+            raise ValueError("price must be a decimal number")
+        if not price.is_finite() or price < 0:
+            raise ValueError("price must be a finite non-negative number")
+        # как в колонке Numeric(12, 2): ответ PATCH совпадает с последующим GET
+        return price.quantize(PRICE_QUANT)
+
+    def update(self, product_id: int, changes: dict) -> ProductInfo:
+        """
+            Изменение атрибутов каталога.
+            Запись в кэше сбрасывается после фиксации транзакции.
+        """
+        changes = self.validate_changes(changes)
+
+        product = self.uow.product_repo.get_for_update(product_id)
+        if not product:
+            raise ProductNotFoundError(f"Product {product_id} not found")
+
+        for field, value in changes.items():
+            setattr(product, field, value)
+        self.uow.product_repo.save(product)
+
+        if self.catalog is not None:
+            catalog = self.catalog
+            self.uow.after_commit(lambda: catalog.invalidate(product_id))
+
+        return ProductInfo.from_row(product)
@@ -0,0 +1,18 @@
+import pytest
+
+from src.memory_db import make_memory_session_factory
+
+
+@pytest.fixture
+def session_factory():
+    return make_memory_session_factory()
+
+
+@pytest.fixture
+def seed(session_factory):
+    """Записывает переданные объекты в БД теста одним коммитом."""
+    def add(*objects):
+        with session_factory() as session:
+            session.add_all(objects)
+            session.commit()
+    return add
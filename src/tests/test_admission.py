@@ -0,0 +1,160 @@
+import threading
+import time
+
+import pytest
+from flask import Flask
+
+from src.api import orders as orders_api
+from src.api import orders_bp
+from src.services import (ProductAdmissionController,
+                          AdmissionQueueFullError,
+                          AdmissionTimeoutError)
+
+
+def hold_slot(controller, product_id, started, release):
+    with controller.acquire(product_id):
+        started.set()
+        release.wait()
+
+
+def test_rejects_immediately_when_queue_is_full():
+    """Очередь по товару заполнена -> AdmissionQueueFullError без ожидания"""
+    controller = ProductAdmissionController(max_concurrency=1, queue_depth=0,
+                                            wait_timeout=5, retry_after=3)
+    started, release = threading.Event(), threading.Event()
+    holder = threading.Thread(target=hold_slot, args=(controller, 1, started, release))
+    holder.start()
+    started.wait()
+
+    begin = time.monotonic()
+    with pytest.raises(AdmissionQueueFullError) as exc_info:
+        with controller.acquire(1):
+            pass
+    assert time.monotonic() - begin < 0.5
+    assert exc_info.value.retry_after == 3
+
+    release.set()
+    holder.join()
+    assert controller.metrics()["rejected_queue_full"] == 1
+
+
+def test_rejects_after_wait_timeout():
+    """Слот не освободился за wait_timeout -> AdmissionTimeoutError"""
+    controller = ProductAdmissionController(max_concurrency=1, queue_depth=1, wait_timeout=0.05)
+    started, release = threading.Event(), threading.Event()
+    holder = threading.Thread(target=hold_slot, args=(controller, 1, started, release))
+    holder.start()
+    started.wait()
+
+    with pytest.raises(AdmissionTimeoutError):
+        with controller.acquire(1):
+            pass
+
+    release.set()
+    holder.join()
+    metrics = controller.metrics()
+    assert metrics["rejected_timeout"] == 1
+    assert metrics["products"] == {}
+
+
+def test_waiter_is_admitted_when_slot_is_released():
+    """Ожидающий запрос получает слот после освобождения"""
+    controller = ProductAdmissionController(max_concurrency=1, queue_depth=1, wait_timeout=5)
+    started, release = threading.Event(), threading.Event()
+    holder = threading.Thread(target=hold_slot, args=(controller, 1, started, release))
+    holder.start()
+    started.wait()
+
+    threading.Timer(0.05, release.set).start()
+    with controller.acquire(1):
+        assert controller.metrics()["in_flight"] == 1
+
+    holder.join()
+    assert controller.metrics()["admitted"] == 2
+
+
+def test_overloaded_product_does_not_slow_down_other_products():
+    """Перегрузка одного SKU не влияет на пропускную способность по остальным"""
+    controller = ProductAdmissionController(max_concurrency=1, queue_depth=2, wait_timeout=0.05)
+    work_time = 0.01
+    hot_results, cold_latencies = [], []
+    results_lock = threading.Lock()
+
+    def hot_request():
+        try:
+            with controller.acquire(1):
+                time.sleep(work_time * 5)
+            outcome = "ok"
+        except (AdmissionQueueFullError, AdmissionTimeoutError) as e:
+            outcome = type(e).__name__
+        with results_lock:
+            hot_results.append(outcome)
+
+    def cold_request(product_id):
+        begin = time.monotonic()
+        with controller.acquire(product_id):
+            time.sleep(work_time)
+        with results_lock:
+            cold_latencies.append(time.monotonic() - begin)
+
+    threads = [threading.Thread(target=hot_request) for _ in range(50)]
+    threads += [threading.Thread(target=cold_request, args=(pid,)) for pid in range(2, 22)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # горячий товар отстреливает лишние запросы, а не копит их
+    assert hot_results.count("ok") < 50
+    assert "AdmissionQueueFullError" in hot_results
+    # все запросы к остальным товарам прошли без ожидания в очереди
+    assert len(cold_latencies) == 20
+    assert max(cold_latencies) < work_time * 5
+
+    metrics = controller.metrics()
+    assert metrics["max_waiting"] <= 2
+    assert metrics["in_flight"] == 0 and metrics["products"] == {}
+
+
+def test_add_item_returns_429_with_retry_after(monkeypatch):
+    """Отказ ограничителя превращается в 429 + Retry-After, UoW и Session не создаются"""
+    controller = ProductAdmissionController(max_concurrency=1, queue_depth=0, retry_after=2)
+    monkeypatch.setattr(orders_api, "admission", controller)
+    created = []
+    monkeypatch.setattr(orders_api, "SqlAlchemyUnitOfWork",
+                        lambda *args, **kwargs: created.append(args))
+    app = Flask(__name__)
+    app.register_blueprint(orders_bp)
+
+    started, release = threading.Event(), threading.Event()
+    holder = threading.Thread(target=hold_slot, args=(controller, 1, started, release))
+    holder.start()
+    started.wait()
+
+    response = app.test_client().post("/api/orders/1/items", json={"product_id": 1, "quantity": 1})
+
+    release.set()
+    holder.join()
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "2"
+    # отклонённый запрос не открывал UoW, а значит и соединение из пула
+    assert created == []
+
+    metrics = app.test_client().get("/api/orders/admission-metrics").get_json()
+    assert metrics["rejected_queue_full"] == 1
+
+
+@pytest.mark.parametrize("body, error", [
+    ({"product_id": [1], "quantity": 1}, "product_id must be integer"),
+    ({"product_id": 1, "quantity": [1]}, "quantity must be integer"),
+    ({"product_id": 1, "quantity": "abc"}, "quantity must be integer"),
+])
+def test_add_item_rejects_non_integer_input(body, error):
+    """product_id или quantity не приводятся к int -> 400 в JSON, а не 500"""
+    app = Flask(__name__)
+    app.register_blueprint(orders_bp)
+
+    response = app.test_client().post("/api/orders/1/items", json=body)
+
+    assert response.status_code == 400
+    assert response.get_json() == {"error": error}
@@ -0,0 +1,141 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import update
+
+from src.models import Order, Product
+from src.services import OrderService, ProductService, ProductCatalogCache, ProductInfo
+from src.unit_of_work import SqlAlchemyUnitOfWork
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def info(product_id, price):
+    return ProductInfo(id=product_id, sku=None, name=f"P{product_id}", category_id=None,
+                       price=Decimal(price))
+
+
+@pytest.fixture
+def tv(seed):
+    seed(Order(id=1), Product(id=1, name="TV", price=1000, stock=10))
+
+
+def test_counts_hits_and_misses():
+    """Первое обращение — промах, повторное — попадание без загрузки"""
+    cache = ProductCatalogCache()
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return info(1, "10")
+
+    cache.get(1, loader)
+    cache.get(1, loader)
+
+    assert len(loads) == 1
+    metrics = cache.metrics()
+    assert (metrics["hits"], metrics["misses"]) == (1, 1)
+
+
+def test_evicts_least_recently_used():
+    """При переполнении вытесняется давно не использованный товар"""
+    cache = ProductCatalogCache(max_size=2)
+    cache.get(1, lambda: info(1, "1"))
+    cache.get(2, lambda: info(2, "2"))
+    cache.get(1, lambda: info(1, "1"))
+    cache.get(3, lambda: info(3, "3"))
+
+    assert cache.get(2, lambda: info(2, "20")).price == Decimal("20")
+    assert cache.metrics()["evictions"] >= 1
+
+
+def test_missing_product_is_not_cached():
+    """Отсутствующий товар не кэшируется"""
+    cache = ProductCatalogCache()
+    assert cache.get(1, lambda: None) is None
+    assert cache.get(1, lambda: info(1, "5")).price == Decimal("5")
+
+
+def test_load_racing_with_invalidate_is_not_cached():
+    """Значение, загруженное до invalidate(), не попадает в кэш"""
+    cache = ProductCatalogCache()
+
+    def stale_loader():
+        cache.invalidate(1)  # обновление закоммитилось, пока шла загрузка
+        return info(1, "1")
+
+    cache.get(1, stale_loader)
+    assert cache.get(1, lambda: info(1, "2")).price == Decimal("2")
+
+
+def test_price_change_is_never_stale_beyond_ttl(session_factory, tv):
+    """Цену изменили в обход приложения: старая цена живёт не дольше ttl"""
+    clock = FakeClock()
+    cache = ProductCatalogCache(ttl=5, clock=clock)
+
+    def served_price():
+        with SqlAlchemyUnitOfWork(session_factory) as uow:
+            return ProductService(uow, cache).get_info(1).price
+
+    assert served_price() == Decimal("1000")
+
+    clock.now = 2.0
+    with session_factory() as session:
+        session.execute(update(Product).where(Product.id == 1).values(price=1500))
+        session.commit()
+
+    for now in (2.0, 3.0, 4.99, 5.0, 6.0, 60.0):
+        clock.now = now
+        price = served_price()
+        if price != Decimal("1500"):
+            # старая цена допустима только пока не истёк ttl с момента загрузки
+            assert now < 5.0
+
+
+def test_update_invalidates_cache_after_commit(session_factory, tv):
+    """Изменение через ProductService сразу видно в add_item"""
+    cache = ProductCatalogCache(ttl=3600)
+
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        assert ProductService(uow, cache).get_info(1).price == Decimal("1000")
+
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        ProductService(uow, cache).update(1, {"price": Decimal("1200")})
+        # до коммита запись ещё в кэше
+        assert cache.metrics()["invalidations"] == 0
+
+    assert cache.metrics()["invalidations"] == 1
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        item = OrderService(uow, cache).add_item(order_id=1, product_id=1, quantity=1)
+        assert item.unit_price == Decimal("1200")
+
+
+def test_rolled_back_update_keeps_cache(session_factory, tv):
+    """Откат изменения не сбрасывает кэш"""
+    cache = ProductCatalogCache(ttl=3600)
+
+    with pytest.raises(RuntimeError):
+        with SqlAlchemyUnitOfWork(session_factory) as uow:
+            ProductService(uow, cache).update(1, {"price": Decimal("1")})
+            raise RuntimeError("boom")
+
+    assert cache.metrics()["invalidations"] == 0
+
+
+def test_add_item_reads_stock_from_db_not_cache(session_factory, tv):
+    """Остаток всегда берётся из БД, даже при закэшированном товаре"""
+    cache = ProductCatalogCache(ttl=3600)
+
+    for _ in range(3):
+        with SqlAlchemyUnitOfWork(session_factory) as uow:
+            OrderService(uow, cache).add_item(order_id=1, product_id=1, quantity=3)
+
+    with session_factory() as session:
+        assert session.get(Product, 1).stock == 1
+    assert cache.metrics()["hits"] == 2
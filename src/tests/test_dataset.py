@@ -0,0 +1,58 @@
+import random
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, func, select
+
+from benchmarks.dataset import DatasetShape, ZipfSampler, generate_categories, populate
+from src.models import Base, Category, Order, OrderItem, Product
+
+
+def test_category_tree_has_requested_shape():
+    """roots * (1 + fanout + fanout^2) категорий, у каждой не-корневой есть родитель"""
+    shape = DatasetShape(category_roots=2, category_depth=3, category_fanout=3)
+    categories = list(generate_categories(shape))
+
+    assert len(categories) == 2 * (1 + 3 + 9)
+    ids = {row[0] for row in categories}
+    assert all(parent_id in ids for _, _, parent_id, depth in categories if depth > 1)
+    assert Counter(depth for *_, depth in categories) == {1: 2, 2: 6, 3: 18}
+
+
+def test_zipf_sampler_favours_top_ranks():
+    """Самый популярный товар выбирается заметно чаще медианного"""
+    sampler = ZipfSampler(n=1000, s=1.1, rnd=random.Random(1))
+    counts = Counter(sampler.sample() for _ in range(20_000))
+
+    top = counts.most_common()
+    assert top[0][1] > 20 * top[len(top) // 2][1]
+    assert len(set(sampler.sample_distinct(50))) == 50
+
+
+def test_populate_loads_consistent_dataset():
+    """Загрузка в SQLite: точное число строк и корректные связи"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    shape = DatasetShape(order_lines=2_000, products=200, clients=50,
+                         category_roots=2, category_depth=2, category_fanout=3, months=3)
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    with engine.begin() as conn:
+        loaded = populate(conn, shape, chunk_size=300, now=now)
+
+    assert loaded["order_items"] == 2_000
+    with engine.connect() as conn:
+        assert conn.scalar(select(func.count()).select_from(OrderItem.__table__)) == 2_000
+        assert conn.scalar(select(func.count()).select_from(Category.__table__)) == 8
+        assert conn.scalar(select(func.count()).select_from(Product.__table__)) == 200
+        assert conn.scalar(select(func.count()).select_from(Order.__table__)) == loaded["orders"]
+
+        duplicates = conn.execute(
+            select(OrderItem.order_id, OrderItem.product_id)
+            .group_by(OrderItem.order_id, OrderItem.product_id)
+            .having(func.count() > 1)
+        ).all()
+        assert duplicates == []
+
+        oldest = conn.scalar(select(func.min(Order.created_at)))
+        assert oldest.replace(tzinfo=timezone.utc) >= now - timedelta(days=90)
@@ -2,22 +2,26 @@ import pytest
 from src.services import (OrderService,
                           OrderNotFoundError,
                           ProductNotFoundError,
-                          OutOfStockError)
+                          OutOfStockError,
+                          OrderNotEditableError)
 
 from src.models import OrderItem
 
 
 class FakeProduct:
-    def __init__(self, id, name, stock, price):
+    def __init__(self, id, name, stock, price, sku=None, category_id=None):
         self.id = id
         self.name = name
         self.stock = stock
         self.price = price
+        self.sku = sku
+        self.category_id = category_id
 
 
 class FakeOrder:
-    def __init__(self, id):
+    def __init__(self, id, status="draft"):
         self.id = id
+        self.status = status
 
 
 class FakeOrderItem(OrderItem):
@@ -44,6 +48,16 @@ class FakeProductRepo:
     def get_for_update(self, id):
         return self.products.get(id)
 
+    def get_catalog_info(self, id):
+        return self.products.get(id)
+
+    def get_stock_for_update(self, id):
+        product = self.products.get(id)
+        return product.stock if product else None
+
+    def decrement_stock(self, id, quantity):
+        self.products[id].stock -= quantity
+
     def save(self, product):
         self.products[product.id] = product
 
@@ -134,4 +148,15 @@ def test_raises_if_not_enough_stock():
     service = OrderService(uow)
 
     with pytest.raises(OutOfStockError):
-        service.add_item(order_id=1, product_id=1, quantity=5)
\ No newline at end of file
+        service.add_item(order_id=1, product_id=1, quantity=5)
+
+
+def test_raises_if_order_is_cancelled():
+    """В отменённый заказ добавлять нельзя -> OrderNotEditableError"""
+    uow = FakeUnitOfWork()
+    uow.orders[1].status = "cancelled"
+    service = OrderService(uow)
+
+    with pytest.raises(OrderNotEditableError):
+        service.add_item(order_id=1, product_id=1, quantity=1)
+    assert uow.products[1].stock == 10
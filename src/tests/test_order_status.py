@@ -0,0 +1,212 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from flask import Flask
+from sqlalchemy import event, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import OperationalError
+
+from src.api import orders as orders_api
+from src.api import orders_bp
+from src.models import Order, OrderItem, OrderStatus, Product
+from src.repositories import ProductRepository
+from src.services import OrderService, InvalidStatusTransitionError, UnknownOrderStatusError
+from src.services.order_status import TRANSITIONS, check_transition
+from src.unit_of_work import SqlAlchemyUnitOfWork
+
+NOW = datetime(2026, 1, 10, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def orders(seed):
+    """5 старых черновиков, 1 свежий, 1 подтверждённый; в каждом по 2 шт. товара 1"""
+    objects = [Product(id=1, name="TV", price=1000, stock=100)]
+    for order_id in range(1, 8):
+        if order_id == 6:
+            created_at, status = NOW, OrderStatus.DRAFT
+        elif order_id == 7:
+            created_at, status = NOW - timedelta(days=5), OrderStatus.CONFIRMED
+        else:
+            # id и created_at упорядочены в разные стороны: заказ 5 — самый старый
+            created_at, status = NOW - timedelta(days=4 + order_id), OrderStatus.DRAFT
+        objects.append(Order(id=order_id, status=status, created_at=created_at))
+        objects.append(OrderItem(order_id=order_id, product_id=1, quantity=2, unit_price=1000))
+    seed(*objects)
+
+
+def make_client(monkeypatch, uow_factory):
+    monkeypatch.setattr(orders_api, "SqlAlchemyUnitOfWork", uow_factory)
+    app = Flask(__name__)
+    app.register_blueprint(orders_bp)
+    return app.test_client()
+
+
+@pytest.fixture
+def client(session_factory, orders, monkeypatch):
+    return make_client(monkeypatch, lambda: SqlAlchemyUnitOfWork(session_factory))
+
+
+@pytest.fixture
+def failing_commit_client(session_factory, orders, monkeypatch):
+    """Клиент, у которого любой commit падает с OperationalError"""
+    def failing_uow():
+        uow = SqlAlchemyUnitOfWork(session_factory)
+
+        def fail(session):
+            raise OperationalError("COMMIT", {}, Exception("server closed the connection"))
+
+        event.listen(uow.session, "before_commit", fail)
+        return uow
+
+    return make_client(monkeypatch, failing_uow)
+
+
+def statuses(session_factory):
+    with session_factory() as session:
+        return dict(session.execute(select(Order.id, Order.status)).all())
+
+
+def stock(session_factory):
+    with session_factory() as session:
+        return session.get(Product, 1).stock
+
+
+def test_final_statuses_have_no_transitions():
+    """Из завершённых статусов выхода нет, все статусы описаны"""
+    assert set(TRANSITIONS) == set(OrderStatus.ALL)
+    for status in OrderStatus.FINAL:
+        assert TRANSITIONS[status] == frozenset()
+
+
+@pytest.mark.parametrize("from_status, to_status", [
+    (OrderStatus.DRAFT, OrderStatus.SHIPPED),
+    (OrderStatus.CANCELLED, OrderStatus.DRAFT),
+    (OrderStatus.COMPLETED, OrderStatus.CANCELLED),
+])
+def test_rejects_invalid_transitions(from_status, to_status):
+    with pytest.raises(InvalidStatusTransitionError):
+        check_transition(from_status, to_status)
+
+
+@pytest.mark.parametrize("status", ["paid", ["draft"], 1])
+def test_rejects_unknown_status(status):
+    with pytest.raises(UnknownOrderStatusError):
+        check_transition(OrderStatus.DRAFT, status)
+
+
+def test_change_status_to_cancelled_releases_stock(session_factory, orders):
+    """Отмена одного заказа возвращает его позиции на склад"""
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        OrderService(uow).change_status(1, OrderStatus.CANCELLED)
+
+    assert statuses(session_factory)[1] == OrderStatus.CANCELLED
+    assert stock(session_factory) == 102
+
+
+def test_change_status_rejects_invalid_transition(session_factory, orders):
+    with pytest.raises(InvalidStatusTransitionError):
+        with SqlAlchemyUnitOfWork(session_factory) as uow:
+            OrderService(uow).change_status(1, OrderStatus.COMPLETED)
+
+    assert statuses(session_factory)[1] == OrderStatus.DRAFT
+
+
+def test_release_locks_products_in_id_order():
+    """Товары блокируются в порядке id, чтобы параллельные отмены не взаимоблокировались"""
+    sql = str(ProductRepository.lock_for_release([1, 2]).compile(dialect=postgresql.dialect()))
+
+    assert sql.endswith("ORDER BY products.id FOR UPDATE")
+
+
+def test_bulk_cancel_old_drafts_in_chunks(session_factory, orders):
+    """Старые черновики отменяются пачками, остаток возвращается, остальные заказы не тронуты"""
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        commits = []
+        event.listen(uow.session, "after_commit", lambda session: commits.append(session))
+        transitioned = OrderService(uow).bulk_transition(
+            OrderStatus.DRAFT, OrderStatus.CANCELLED,
+            created_before=NOW - timedelta(days=1),
+            chunk_size=2,
+        )
+
+    assert transitioned == 5
+    assert len(commits) == 4  # пачки 2 + 2 + 1 и пустая проверка при выходе из UoW
+    assert statuses(session_factory) == {
+        1: OrderStatus.CANCELLED, 2: OrderStatus.CANCELLED, 3: OrderStatus.CANCELLED,
+        4: OrderStatus.CANCELLED, 5: OrderStatus.CANCELLED,
+        6: OrderStatus.DRAFT, 7: OrderStatus.CONFIRMED,
+    }
+    assert stock(session_factory) == 110
+
+
+def test_bulk_confirm_respects_limit_and_keeps_stock(session_factory, orders):
+    """Подтверждение не трогает остаток; limit ограничивает число заказов"""
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        transitioned = OrderService(uow).bulk_transition(
+            OrderStatus.DRAFT, OrderStatus.CONFIRMED, chunk_size=4, limit=5,
+        )
+
+    assert transitioned == 5
+    assert list(statuses(session_factory).values()).count(OrderStatus.CONFIRMED) == 6
+    assert stock(session_factory) == 100
+
+
+def test_bulk_transition_validates_before_touching_rows(session_factory, orders):
+    with pytest.raises(InvalidStatusTransitionError):
+        with SqlAlchemyUnitOfWork(session_factory) as uow:
+            OrderService(uow).bulk_transition(OrderStatus.DRAFT, OrderStatus.COMPLETED)
+
+    assert uow._session is None
+
+
+def test_bulk_transition_takes_oldest_orders_first(session_factory, orders):
+    """Пачка выбирается в порядке created_at (как в частичном индексе), а не по id"""
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        OrderService(uow).bulk_transition(OrderStatus.DRAFT, OrderStatus.CONFIRMED, limit=2)
+
+    confirmed = {order_id for order_id, status in statuses(session_factory).items()
+                 if status == OrderStatus.CONFIRMED}
+    assert confirmed == {4, 5, 7}
+
+
+def test_change_status_api_maps_errors(client):
+    """Неизвестный статус -> 400, запрещённый переход -> 409"""
+    assert client.post("/api/orders/1/status", json={"status": "paid"}).status_code == 400
+    assert client.post("/api/orders/1/status", json={"status": ["draft"]}).status_code == 400
+    assert client.post("/api/orders/1/status", json={"status": "completed"}).status_code == 409
+
+    response = client.post("/api/orders/1/status", json={"status": "confirmed"})
+    assert response.get_json() == {"id": 1, "status": OrderStatus.CONFIRMED}
+
+
+def test_bulk_transition_api_validates_input(client, session_factory):
+    """Неизвестный статус и время без смещения -> 400, запрещённый переход -> 409"""
+    def post(**body):
+        return client.post("/api/orders/transitions", json=body)
+
+    assert post(from_status="draft", to_status="paid").status_code == 400
+    assert post(from_status=["draft"], to_status="cancelled").status_code == 400
+    assert post(from_status="draft", to_status={"x": 1}).status_code == 400
+    assert post(from_status="draft", to_status="completed").status_code == 409
+    assert post(from_status="draft", to_status="cancelled",
+                created_before="2026-01-09T00:00:00").status_code == 400
+    assert statuses(session_factory)[1] == OrderStatus.DRAFT
+
+    response = post(from_status="draft", to_status="cancelled",
+                    created_before="2026-01-09T00:00:00+00:00")
+    assert response.get_json() == {"transitioned": 5}
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/api/orders/1/status", {"status": "cancelled"}),
+    ("/api/orders/transitions", {"from_status": "draft", "to_status": "cancelled"}),
+])
+def test_status_routes_return_json_when_commit_fails(failing_commit_client, session_factory,
+                                                     path, body):
+    """Сбой commit -> 500 в JSON, статусы и остаток не меняются"""
+    response = failing_commit_client.post(path, json=body)
+
+    assert response.status_code == 500
+    assert response.get_json()["error"].startswith("Internal error:")
+    assert statuses(session_factory)[1] == OrderStatus.DRAFT
+    assert stock(session_factory) == 100
@@ -0,0 +1,85 @@
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+
+from src.api import products as products_api
+from src.api import products_bp
+from src.models import Category, Product
+from src.services import ProductService, ProductCatalogCache
+from src.unit_of_work import SqlAlchemyUnitOfWork
+
+
+@pytest.fixture
+def client(session_factory, seed, monkeypatch):
+    seed(Category(id=1, name="TV"), Product(id=1, name="TV", price=1000, stock=10, category_id=1))
+    monkeypatch.setattr(products_api, "SqlAlchemyUnitOfWork",
+                        lambda: SqlAlchemyUnitOfWork(session_factory))
+    monkeypatch.setattr(products_api, "catalog_cache", ProductCatalogCache())
+    app = Flask(__name__)
+    app.register_blueprint(products_bp)
+    return app.test_client()
+
+
+@pytest.mark.parametrize("changes", [
+    {"name": None},
+    {"name": "   "},
+    {"name": 5},
+    {"sku": 12},
+    {"price": "NaN"},
+    {"price": "Infinity"},
+    {"price": "-3"},
+    {"price": "abc"},
+    {"price": None},
+    {"price": True},
+    {"category_id": "abc"},
+    {"category_id": 1.5},
+    {"stock": 100},
+])
+def test_validate_changes_rejects_bad_values(changes):
+    with pytest.raises(ValueError):
+        ProductService.validate_changes(changes)
+
+
+def test_validate_changes_quantizes_price():
+    """Цена приводится к двум знакам, как в колонке Numeric(12, 2)"""
+    assert ProductService.validate_changes({"price": "12.5"})["price"] == Decimal("12.50")
+    assert ProductService.validate_changes({"price": 7})["price"] == Decimal("7.00")
+
+
+@pytest.mark.parametrize("body", [
+    {"name": None},
+    {"price": "NaN"},
+    {"price": "-3"},
+    {"category_id": "abc"},
+    [{"name": "x"}],
+    {"product_id": 5},
+    {"self": 1},
+])
+def test_patch_returns_json_400_for_invalid_body(client, body):
+    response = client.patch("/api/products/1", json=body)
+
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+    assert client.get("/api/products/1").get_json()["price"] == "1000.00"
+
+
+def test_patch_missing_category_returns_json_400(client):
+    """Нарушение внешнего ключа -> 400 в JSON, изменение откатывается"""
+    response = client.patch("/api/products/1", json={"category_id": 999})
+
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+    assert client.get("/api/products/1").get_json()["category_id"] == 1
+
+
+def test_patch_response_matches_following_get(client):
+    response = client.patch("/api/products/1", json={"price": "12.5", "name": "OLED TV"})
+
+    assert response.status_code == 200
+    assert response.get_json() == client.get("/api/products/1").get_json()
+    assert response.get_json()["price"] == "12.50"
+
+
+def test_patch_unknown_product_returns_404(client):
+    assert client.patch("/api/products/99", json={"name": "x"}).status_code == 404
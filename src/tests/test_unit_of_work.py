@@ -0,0 +1,92 @@
+import pytest
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+
+from src.api import orders as orders_api
+from src.api import orders_bp
+from src.models import Order, OrderItem, Product
+from src.services import OrderService
+from src.unit_of_work import SqlAlchemyUnitOfWork
+
+
+@pytest.fixture(autouse=True)
+def order_and_product(seed):
+    seed(Order(id=1), Product(id=1, name="TV", price=1000, stock=10))
+
+
+def count_commits(uow):
+    commits = []
+    event.listen(uow.session, "after_commit", lambda session: commits.append(session))
+    return commits
+
+
+def test_session_is_not_created_until_used(session_factory):
+    """Пустой UoW не открывает Session"""
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        pass
+
+    assert uow._session is None
+
+
+def test_repositories_are_created_lazily_and_share_session(session_factory):
+    """Репозиторий создаётся при первом обращении и переиспользуется"""
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        assert "order_repo" not in uow.__dict__
+        assert uow.order_repo is uow.order_repo
+        assert uow.order_repo.session is uow.product_repo.session is uow.session
+
+
+def test_add_item_commits_exactly_once(session_factory):
+    """Явный commit() + выход из контекста = один commit"""
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        commits = count_commits(uow)
+        OrderService(uow).add_item(order_id=1, product_id=1, quantity=2)
+        uow.commit()
+
+    assert len(commits) == 1
+
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        commits = count_commits(uow)
+        item = OrderService(uow).add_item(order_id=1, product_id=1, quantity=3)
+        assert item.quantity == 5
+
+    assert len(commits) == 1
+
+    with session_factory() as session:
+        assert session.get(Product, 1).stock == 5
+
+
+def test_exit_with_exception_rolls_back(session_factory):
+    """Исключение внутри UoW откатывает изменения"""
+    with pytest.raises(RuntimeError):
+        with SqlAlchemyUnitOfWork(session_factory) as uow:
+            OrderService(uow).add_item(order_id=1, product_id=1, quantity=2)
+            raise RuntimeError("boom")
+
+    with session_factory() as session:
+        assert session.get(Product, 1).stock == 10
+
+
+def test_add_item_route_returns_json_when_commit_fails(session_factory, monkeypatch):
+    """Сбой commit -> 500 в JSON, изменения откатываются"""
+    def failing_uow():
+        uow = SqlAlchemyUnitOfWork(session_factory)
+
+        def fail(session):
+            raise OperationalError("COMMIT", {}, Exception("server closed the connection"))
+
+        event.listen(uow.session, "before_commit", fail)
+        return uow
+
+    monkeypatch.setattr(orders_api, "SqlAlchemyUnitOfWork", failing_uow)
+    app = Flask(__name__)
+    app.register_blueprint(orders_bp)
+
+    response = app.test_client().post("/api/orders/1/items", json={"product_id": 1, "quantity": 2})
+
+    assert response.status_code == 500
+    assert response.get_json()["error"].startswith("Internal error:")
+    with session_factory() as session:
+        assert session.get(Product, 1).stock == 10
+        assert session.query(OrderItem).count() == 0
@@ -1,31 +1,75 @@
 from contextlib import AbstractContextManager
+from functools import cached_property
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
 from src.extensions import SessionLocal
 from src.repositories import OrderRepository, OrderItemRepository, ProductRepository
 
 
 class SqlAlchemyUnitOfWork(AbstractContextManager):
-    """Unit of Work — управляет транзакцией и хранит репозитории."""
+    """
+    Unit of Work — управляет транзакцией и хранит репозитории.
+
+    Session и репозитории создаются лениво, при первом обращении:
+    запросы, которые не ходят в БД, не платят за их создание.
+    Транзакция фиксируется ровно один раз — явным commit()
+    или при выходе из контекста, если она ещё открыта.
+    Колбэки after_commit() вызываются только после успешного commit
+    (например, сброс кэша каталога).
+    """
+
+    def __init__(self, session_factory=SessionLocal):
+        self._session_factory = session_factory
+        self._session: Session | None = None
+        self._after_commit: list[Callable[[], None]] = []
 
-    def __init__(self):
-        self.session = SessionLocal()
-        self.order_repo = OrderRepository(self.session)
-        self.product_repo = ProductRepository(self.session)
-        self.item_repo = OrderItemRepository(self.session)
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    @cached_property
+    def order_repo(self) -> OrderRepository:
+        return OrderRepository(self.session)
+
+    @cached_property
+    def product_repo(self) -> ProductRepository:
+        return ProductRepository(self.session)
+
+    @cached_property
+    def item_repo(self) -> OrderItemRepository:
+        return OrderItemRepository(self.session)
 
     def __enter__(self):
-        self.tx = self.session.begin()
-        self.tx.__enter__()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if exc_type:
-            self.session.rollback()
-        else:
-            self.session.commit()
-        self.session.close()
+        if self._session is None:
+            return
+        try:
+            if exc_type:
+                self._session.rollback()
+            elif self._session.in_transaction():
+                self.commit()
+        finally:
+            self._after_commit.clear()
+            self._session.close()
+
+    def after_commit(self, callback: Callable[[], None]):
+        """Выполнить callback после успешной фиксации транзакции."""
+        self._after_commit.append(callback)
 
     def commit(self):
-        self.session.commit()
+        if self._session is not None:
+            self._session.commit()
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            callback()
 
     def rollback(self):
-        self.session.rollback()
+        self._after_commit.clear()
+        if self._session is not None:
+            self._session.rollback()